@@ -157,7 +157,7 @@ func resetToAutoSettings(root string) {
 
 	fmt.Printf("\n%s", dividerLine())
 	fmt.Printf("%s", successLine("Memory settings reset to auto"))
-	fmt.Printf("  ■ Auto RAM enabled\n")
+	fmt.Print("  ■ Auto RAM enabled\n")
 	fmt.Printf("  ■ Baseline memory: %d GB\n", settings.MemoryMB/1024)
 	fmt.Printf("%s", dividerLine())
 }
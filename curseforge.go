@@ -2,6 +2,7 @@ package main
 
 import (
 	"compress/gzip"
+	"errors"
 	"fmt"
 	"io"
 	"net/http"
@@ -15,6 +16,62 @@ import (
 
 // -------------------- CurseForge Direct Download --------------------
 
+// CurseForge page patterns are compiled once at startup rather than on every
+// scrape attempt (each manual mod can be retried several times)
+var (
+	// <dt>Project ID</dt><dd><div class="project-id-container"><span class="project-id">433760</span>
+	curseForgeProjectIDRe = regexp.MustCompile(`<dt>Project ID</dt>\s*<dd>\s*<div[^>]*class="project-id-container"[^>]*>\s*<span[^>]*class="project-id"[^>]*>(\d+)</span>`)
+
+	// More flexible patterns - try many different ways the project ID might appear
+	curseForgeProjectIDFallbackRes = compilePatterns(
+		// Various HTML patterns for project ID
+		`<span[^>]*class="project-id"[^>]*>(\d+)</span>`,
+		`<dt>Project ID</dt>\s*<dd>(\d+)</dd>`,
+		`<dt>Project ID</dt>\s*<dd>\s*(\d+)\s*</dd>`,
+		`<div[^>]*project-id[^>]*>(\d+)</div>`,
+		`data-project-id="(\d+)"`,
+		`project-id="(\d+)"`,
+
+		// JSON patterns in embedded data
+		`"project_id":\s*(\d+)`,
+		`"projectId":\s*(\d+)`,
+		`"project":\s*\{[^}]*"id":\s*(\d+)`,
+		`"project":\{[^}]*"id":(\d+)`,
+		`globalThis\.project[^=]*=\s*\{[^}]*"id":\s*(\d+)`,
+		`window\.project[^=]*=\s*\{[^}]*"id":\s*(\d+)`,
+		`"eagerProject":\{[^}]*"id":\s*(\d+)`,
+		`"projectData":\{[^}]*"id":\s*(\d+)`,
+		`"data":[^}]*"id":\s*(\d+)`,
+
+		// More general numeric patterns in project context
+		`"file_id":\d+.*?"project_id":\s*(\d+)`,
+		`"fileId":\d+.*?"projectId":\s*(\d+)`,
+		`"slug":"[^"]*".*?"id":(\d+)`,
+	)
+
+	// Pattern: https://www.curseforge.com/minecraft/mc-mods/mod-name/files/1234567
+	// Pattern: https://www.curseforge.com/minecraft/texture-packs/pack-name/files/1234567
+	curseForgeFileURLRe = regexp.MustCompile(`https://www\.curseforge\.com/([^/]+)/([^/]+)/([^/]+)/files/(\d+)`)
+
+	// Look for various CurseForge download patterns
+	curseForgeDownloadLinkRes = compilePatterns(
+		`"downloadUrl":"([^"]+\.jar)"`,
+		`"url":"([^"]+\.jar)"`,
+		`href="([^"]+\.jar)"`,
+		`data-download="([^"]+)"`,
+	)
+)
+
+// compilePatterns compiles a fixed list of regular expressions, panicking on
+// an invalid pattern like regexp.MustCompile
+func compilePatterns(patterns ...string) []*regexp.Regexp {
+	res := make([]*regexp.Regexp, len(patterns))
+	for i, pattern := range patterns {
+		res[i] = regexp.MustCompile(pattern)
+	}
+	return res
+}
+
 // downloadFromCurseForge attempts to download JAR files directly from CurseForge URLs
 func downloadFromCurseForge(url, destPath string) error {
 	// Handle CurseForge URLs with retry logic
@@ -33,10 +90,8 @@ func downloadCurseForgeFileWithRetry(pageURL, destPath string, maxRetries int) e
 	for attempt := 1; attempt <= maxRetries; attempt++ {
 		logf("  Attempt %d/%d...", attempt, maxRetries)
 
-		// Remove any existing partial download
-		if exists(destPath) {
-			os.Remove(destPath)
-		}
+		// Remove any existing partial download (missing file is fine)
+		_ = os.Remove(destPath)
 
 		err := downloadCurseForgeFile(pageURL, destPath)
 		if err == nil {
@@ -133,42 +188,13 @@ func getProjectIDFromFilePage(filePageURL string) (string, error) {
 
 	html := string(body)
 
-	// Look for the specific pattern: <dt>Project ID</dt><dd><div class="project-id-container"><span class="project-id">433760</span>
-	projectIDPattern := regexp.MustCompile(`<dt>Project ID</dt>\s*<dd>\s*<div[^>]*class="project-id-container"[^>]*>\s*<span[^>]*class="project-id"[^>]*>(\d+)</span>`)
-	matches := projectIDPattern.FindStringSubmatch(html)
+	// Look for the specific project-id container first
+	matches := curseForgeProjectIDRe.FindStringSubmatch(html)
 	if len(matches) > 1 {
 		return matches[1], nil
 	}
 
-	// More flexible patterns - try many different ways the project ID might appear
-	patterns := []string{
-		// Various HTML patterns for project ID
-		`<span[^>]*class="project-id"[^>]*>(\d+)</span>`,
-		`<dt>Project ID</dt>\s*<dd>(\d+)</dd>`,
-		`<dt>Project ID</dt>\s*<dd>\s*(\d+)\s*</dd>`,
-		`<div[^>]*project-id[^>]*>(\d+)</div>`,
-		`data-project-id="(\d+)"`,
-		`project-id="(\d+)"`,
-
-		// JSON patterns in embedded data
-		`"project_id":\s*(\d+)`,
-		`"projectId":\s*(\d+)`,
-		`"project":\s*\{[^}]*"id":\s*(\d+)`,
-		`"project":\{[^}]*"id":(\d+)`,
-		`globalThis\.project[^=]*=\s*\{[^}]*"id":\s*(\d+)`,
-		`window\.project[^=]*=\s*\{[^}]*"id":\s*(\d+)`,
-		`"eagerProject":\{[^}]*"id":\s*(\d+)`,
-		`"projectData":\{[^}]*"id":\s*(\d+)`,
-		`"data":[^}]*"id":\s*(\d+)`,
-
-		// More general numeric patterns in project context
-		`"file_id":\d+.*?"project_id":\s*(\d+)`,
-		`"fileId":\d+.*?"projectId":\s*(\d+)`,
-		`"slug":"[^"]*".*?"id":(\d+)`,
-	}
-
-	for _, pattern := range patterns {
-		re := regexp.MustCompile(pattern)
+	for _, re := range curseForgeProjectIDFallbackRes {
 		matches := re.FindStringSubmatch(html)
 		if len(matches) > 1 {
 			projectID := matches[1]
@@ -178,17 +204,14 @@ func getProjectIDFromFilePage(filePageURL string) (string, error) {
 		}
 	}
 
-	return "", fmt.Errorf("project ID not found in file page")
+	return "", errors.New("project ID not found in file page")
 }
 
 // parseCurseForgeFileURL extracts game, category, project slug, and file ID from a CurseForge file URL
 func parseCurseForgeFileURL(url string) (game, category, projectSlug, fileID string, err error) {
-	// Pattern: https://www.curseforge.com/minecraft/mc-mods/mod-name/files/1234567
-	// Pattern: https://www.curseforge.com/minecraft/texture-packs/pack-name/files/1234567
-	re := regexp.MustCompile(`https://www\.curseforge\.com/([^/]+)/([^/]+)/([^/]+)/files/(\d+)`)
-	matches := re.FindStringSubmatch(url)
+	matches := curseForgeFileURLRe.FindStringSubmatch(url)
 	if len(matches) != 5 {
-		return "", "", "", "", fmt.Errorf("invalid CurseForge URL format")
+		return "", "", "", "", errors.New("invalid CurseForge URL format")
 	}
 
 	return matches[1], matches[2], matches[3], matches[4], nil
@@ -284,21 +307,12 @@ func downloadCurseForgeFromPage(pageURL, destPath string) error {
 		return downloadTo(downloadURL, destPath, 0644)
 	}
 
-	return fmt.Errorf("could not extract direct download link from CurseForge page")
+	return errors.New("could not extract direct download link from CurseForge page")
 }
 
 // extractCurseForgeDownloadLink attempts to find the direct download URL from CurseForge page HTML
 func extractCurseForgeDownloadLink(html string) string {
-	// Look for various CurseForge download patterns
-	patterns := []string{
-		`"downloadUrl":"([^"]+\.jar)"`,
-		`"url":"([^"]+\.jar)"`,
-		`href="([^"]+\.jar)"`,
-		`data-download="([^"]+)"`,
-	}
-
-	for _, pattern := range patterns {
-		re := regexp.MustCompile(pattern)
+	for _, re := range curseForgeDownloadLinkRes {
 		matches := re.FindStringSubmatch(html)
 		if len(matches) > 1 {
 			// Unescape JSON-encoded URL if needed
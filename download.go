@@ -12,30 +12,38 @@ import (
 	"path/filepath"
 	"runtime"
 	"strings"
+	"sync"
 	"time"
 )
 
 // -------------------- Downloads / Unzip --------------------
 
+// progressStep is the minimum change in percent between two progress lines
+const progressStep = 5
+
 type progressWriter struct {
-	total      int64
-	downloaded int64
-	filename   string
-	startTime  time.Time
+	total       int64
+	downloaded  int64
+	filename    string
+	startTime   time.Time
+	lastPercent int // last percentage written to out
 }
 
 func (pw *progressWriter) Write(p []byte) (int, error) {
 	n := len(p)
-	err := error(nil)
 	pw.downloaded += int64(n)
 
-	// Update progress every 1MB or every second
-	if pw.downloaded%1048576 == 0 || time.Since(pw.startTime) > time.Second {
-		pw.updateProgress()
-		pw.startTime = time.Now()
+	// Only report when the percentage has moved by a full step; every line
+	// goes through the log tee, which syncs the log file on each write
+	if pw.total > 0 {
+		percent := int(pw.downloaded * 100 / pw.total)
+		if percent-pw.lastPercent >= progressStep || (percent >= 100 && pw.lastPercent < 100) {
+			pw.lastPercent = percent
+			pw.updateProgress()
+		}
 	}
 
-	return n, err
+	return n, nil
 }
 
 func (pw *progressWriter) updateProgress() {
@@ -46,11 +54,95 @@ func (pw *progressWriter) updateProgress() {
 		elapsed := time.Since(pw.startTime).Seconds()
 		if elapsed > 0 {
 			speedMBps := (float64(pw.downloaded) / (1024 * 1024)) / elapsed
-			fmt.Fprintf(out, "\rDownloading %s (%.1f MB/s, %d%%)", pw.filename, speedMBps, int(percent))
+			downloadProgress.update(pw, fmt.Sprintf("%s (%.1f MB/s, %d%%)", pw.filename, speedMBps, int(percent)))
 		} else {
-			fmt.Fprintf(out, "\rDownloading %s (%d%%)", pw.filename, int(percent))
+			downloadProgress.update(pw, fmt.Sprintf("%s (%d%%)", pw.filename, int(percent)))
+		}
+	}
+}
+
+// progressDisplay owns the \r progress line on out. Downloads that run at the
+// same time (the JRE and packwiz tools are fetched alongside Prism) share one
+// line instead of overwriting each other's progress.
+type progressDisplay struct {
+	mu      sync.Mutex
+	active  []*progressWriter
+	status  map[*progressWriter]string
+	showing bool // a progress line is on screen without a trailing newline
+}
+
+var downloadProgress = &progressDisplay{status: map[*progressWriter]string{}}
+
+// update records the latest status of pw and redraws the progress line
+func (d *progressDisplay) update(pw *progressWriter, status string) {
+	d.mu.Lock()
+	defer d.mu.Unlock()
+
+	if _, ok := d.status[pw]; !ok {
+		d.active = append(d.active, pw)
+	}
+	d.status[pw] = status
+	d.render()
+}
+
+// println ends the progress line, writes msg on a line of its own and then
+// redraws the downloads that are still running
+func (d *progressDisplay) println(msg string) {
+	d.mu.Lock()
+	defer d.mu.Unlock()
+	d.printLine(msg + "\n")
+}
+
+// log writes a complete log message the same way as println; logf goes
+// through here so log lines from any goroutine never land on a progress line
+func (d *progressDisplay) log(message string) {
+	d.mu.Lock()
+	defer d.mu.Unlock()
+	d.printLine(message)
+}
+
+// finish removes pw from the progress line and reports msg (if any)
+func (d *progressDisplay) finish(pw *progressWriter, msg string) {
+	d.mu.Lock()
+	defer d.mu.Unlock()
+
+	if _, ok := d.status[pw]; ok {
+		delete(d.status, pw)
+		for i, p := range d.active {
+			if p == pw {
+				d.active = append(d.active[:i], d.active[i+1:]...)
+				break
+			}
 		}
 	}
+	if msg != "" {
+		msg += "\n"
+	}
+	d.printLine(msg)
+}
+
+// printLine writes message, which carries its own trailing newline, below
+// the progress line and then redraws the downloads that are still running
+func (d *progressDisplay) printLine(message string) {
+	if d.showing {
+		fmt.Fprint(out, "\n")
+		d.showing = false
+	}
+	if message != "" {
+		writeLogMessage(message)
+	}
+	if len(d.active) > 0 {
+		d.render()
+	}
+}
+
+func (d *progressDisplay) render() {
+	parts := make([]string, len(d.active))
+	for i, pw := range d.active {
+		parts[i] = d.status[pw]
+	}
+	fmt.Fprintf(out, "\rDownloading %s", strings.Join(parts, ", "))
+	d.showing = true
 }
 
 func downloadTo(url, path string, mode os.FileMode) error {
@@ -61,13 +153,11 @@ func downloadTo(url, path string, mode os.FileMode) error {
 		return err
 	}
 
-	// Verify the directory exists before writing
-	if dir := filepath.Dir(path); !exists(dir) {
-		debugf("Creating directory %s before writing file", dir)
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			debugf("Failed to create directory %s: %v", dir, err)
-			return err
-		}
+	// Make sure the directory exists before writing
+	dir := filepath.Dir(path)
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		debugf("Failed to create directory %s: %v", dir, err)
+		return err
 	}
 
 	err = os.WriteFile(path, b, mode)
@@ -89,12 +179,9 @@ func downloadAndUnzipTo(url, dest string) error {
 	}
 
 	// Ensure destination directory exists
-	if !exists(dest) {
-		debugf("Creating destination directory %s", dest)
-		if err := os.MkdirAll(dest, 0755); err != nil {
-			debugf("Failed to create destination directory %s: %v", dest, err)
-			return err
-		}
+	if err := os.MkdirAll(dest, 0755); err != nil {
+		debugf("Failed to create destination directory %s: %v", dest, err)
+		return err
 	}
 
 	err = extractBytesTo(b, dest, url)
@@ -137,6 +224,7 @@ func untarBytesTo(b []byte, dest string) error {
 
 	// Then extract tar
 	tarReader := tar.NewReader(gzReader)
+	dirs := dirSet{}
 
 	for {
 		header, err := tarReader.Next()
@@ -152,13 +240,13 @@ func untarBytesTo(b []byte, dest string) error {
 		switch header.Typeflag {
 		case tar.TypeDir:
 			// Create directory
-			if err := os.MkdirAll(targetPath, os.FileMode(header.Mode)); err != nil {
+			if err := dirs.ensure(targetPath, os.FileMode(header.Mode)); err != nil {
 				return fmt.Errorf("failed to create directory %s: %w", targetPath, err)
 			}
 
 		case tar.TypeReg:
 			// Create file
-			if err := os.MkdirAll(filepath.Dir(targetPath), 0755); err != nil {
+			if err := dirs.ensure(filepath.Dir(targetPath), 0755); err != nil {
 				return fmt.Errorf("failed to create parent directory for %s: %w", targetPath, err)
 			}
 
@@ -167,7 +255,7 @@ func untarBytesTo(b []byte, dest string) error {
 				return fmt.Errorf("failed to create file %s: %w", targetPath, err)
 			}
 
-			if _, err := io.Copy(outFile, tarReader); err != nil {
+			if _, err := copyBuffered(outFile, tarReader); err != nil {
 				outFile.Close()
 				return fmt.Errorf("failed to write file %s: %w", targetPath, err)
 			}
@@ -221,18 +309,19 @@ func downloadWithProgress(url string) ([]byte, error) {
 
 	// If we don't know the content length, show indefinite progress
 	if contentLength <= 0 {
-		fmt.Fprintf(out, "Downloading %s...", filename)
+		downloadProgress.println(fmt.Sprintf("Downloading %s...", filename))
 		return io.ReadAll(resp.Body)
 	}
 
 	// Read with progress tracking
 	body, err := io.ReadAll(io.TeeReader(resp.Body, pw))
 	if err != nil {
+		downloadProgress.finish(pw, "")
 		return nil, err
 	}
 
 	// Show completion
-	fmt.Fprintf(out, "\nDownloaded %s (%.1f MB)\n", filename, float64(contentLength)/(1024*1024))
+	downloadProgress.finish(pw, fmt.Sprintf("Downloaded %s (%.1f MB)", filename, float64(contentLength)/(1024*1024)))
 
 	return body, nil
 }
@@ -247,13 +336,14 @@ func unzipBytesTo(b []byte, dest string) error {
 
 	fileCount := 0
 	dirCount := 0
+	dirs := dirSet{}
 	for _, f := range r.File {
 		p := filepath.Join(dest, f.Name)
 		debugf("Processing ZIP entry: %s (size: %d, compressed: %d)", f.Name, f.UncompressedSize64, f.CompressedSize64)
 
 		if f.FileInfo().IsDir() {
 			dirCount++
-			if err := os.MkdirAll(p, 0755); err != nil {
+			if err := dirs.ensure(p, 0755); err != nil {
 				debugf("Failed to create directory %s: %v", p, err)
 				return err
 			}
@@ -261,7 +351,7 @@ func unzipBytesTo(b []byte, dest string) error {
 		}
 
 		fileCount++
-		if err := os.MkdirAll(filepath.Dir(p), 0755); err != nil {
+		if err := dirs.ensure(filepath.Dir(p), 0755); err != nil {
 			debugf("Failed to create parent directory for %s: %v", p, err)
 			return err
 		}
@@ -279,7 +369,7 @@ func unzipBytesTo(b []byte, dest string) error {
 			return err
 		}
 
-		written, err := io.Copy(outf, rc)
+		written, err := copyBuffered(outf, rc)
 		outf.Close()
 		rc.Close()
 
@@ -49,6 +49,7 @@ type GUI struct {
 	modpacks       []Modpack
 	filtered       []Modpack
 	searchQuery    string
+	filterTimer    *time.Timer // debounces searchQuery changes
 	activeCategory string
 	root           string
 	exePath        string
@@ -82,8 +83,10 @@ type GUI struct {
 	runningMu        sync.RWMutex
 	processMu        sync.Mutex
 
-	// Process registry for reattachment
-	processRegistry *ProcessRegistry
+	// Process registry for reattachment (loaded in the background, read via registry())
+	processRegistry  *ProcessRegistry
+	registryReady    chan struct{}
+	registryDeadline time.Time
 }
 
 // modernTheme tweaks the default Fyne look.
@@ -281,6 +284,9 @@ const (
 	viewFeatured = "featured"
 )
 
+// searchDebounce is how long search input must be idle before the browse grid is rebuilt
+const searchDebounce = 200 * time.Millisecond
+
 // NewGUI spins up the modern application shell.
 func NewGUI(modpacks []Modpack, root string) *GUI {
 	a := app.New()
@@ -299,40 +305,48 @@ func NewGUI(modpacks []Modpack, root string) *GUI {
 		}
 	}
 
-	// Initialize process registry asynchronously to avoid blocking GUI
-	var processRegistry *ProcessRegistry
-	var initErr error
-
-	// Use a channel to signal completion
-	initDone := make(chan struct{})
+	gui := &GUI{
+		app:              a,
+		window:           w,
+		modpacks:         modpacks,
+		filtered:         append([]Modpack(nil), modpacks...),
+		root:             root,
+		modpackStates:    make(map[string]*ModpackState),
+		cardBindings:     make(map[string][]*modpackCardBinding),
+		registryReady:    make(chan struct{}),
+		registryDeadline: time.Now().Add(5 * time.Second),
+	}
+
+	// Initialize process registry in the background so the window can paint
+	// right away; the first caller of registry() waits for it instead
 	go func() {
-		processRegistry, initErr = GetGlobalProcessRegistry(root)
-		close(initDone)
+		processRegistry, err := GetGlobalProcessRegistry(root)
+		if err != nil {
+			logf("Warning: Failed to initialize process registry: %v", err)
+		}
+		gui.processRegistry = processRegistry
+		close(gui.registryReady)
 	}()
 
-	// Wait for initialization with timeout to avoid blocking GUI forever
+	return gui
+}
+
+// registry returns the process registry once background initialization has
+// finished, or nil if it failed or did not finish within the startup deadline
+func (g *GUI) registry() *ProcessRegistry {
 	select {
-	case <-initDone:
-		if initErr != nil {
-			logf("Warning: Failed to initialize process registry: %v", initErr)
-		}
-	case <-time.After(5 * time.Second):
-		logf("Warning: Process registry initialization timed out, continuing without it")
-		processRegistry = nil
+	case <-g.registryReady:
+		return g.processRegistry
+	default:
 	}
 
-	gui := &GUI{
-		app:             a,
-		window:          w,
-		modpacks:        modpacks,
-		filtered:        append([]Modpack(nil), modpacks...),
-		root:            root,
-		modpackStates:   make(map[string]*ModpackState),
-		cardBindings:    make(map[string][]*modpackCardBinding),
-		processRegistry: processRegistry,
+	select {
+	case <-g.registryReady:
+		return g.processRegistry
+	case <-time.After(time.Until(g.registryDeadline)):
+		logf("Warning: Process registry initialization timed out, continuing without it")
+		return nil
 	}
-
-	return gui
 }
 
 // Show renders and runs the window loop.
@@ -341,11 +355,9 @@ func (g *GUI) Show() {
 	g.startUpdateCheck()
 
 	// Validate existing processes asynchronously to avoid blocking GUI
-	if g.processRegistry != nil {
-		go func() {
-			g.validateExistingProcesses()
-		}()
-	}
+	go func() {
+		g.validateExistingProcesses()
+	}()
 
 	// Set up window close callback to clean up resources
 	g.window.SetCloseIntercept(func() {
@@ -358,17 +370,18 @@ func (g *GUI) Show() {
 
 // validateExistingProcesses validates existing processes in the registry and updates modpack states
 func (g *GUI) validateExistingProcesses() {
-	if g.processRegistry == nil {
+	registry := g.registry()
+	if registry == nil {
 		return
 	}
 
 	// Validate all processes in the registry
-	if err := g.processRegistry.ValidateProcesses(); err != nil {
+	if err := registry.ValidateProcesses(); err != nil {
 		logf("Warning: Failed to validate processes: %v", err)
 	}
 
 	// Get all running processes
-	runningProcesses := g.processRegistry.GetRunningProcesses()
+	runningProcesses := registry.GetRunningProcesses()
 
 	// Update modpack states with reattachment information
 	for _, process := range runningProcesses {
@@ -431,7 +444,7 @@ func (g *GUI) buildHeader() fyne.CanvasObject {
 	g.searchEntry.SetPlaceHolder("Search modpacks...")
 	g.searchEntry.OnChanged = func(q string) {
 		g.searchQuery = strings.TrimSpace(q)
-		g.applyFilters()
+		g.scheduleApplyFilters()
 	}
 
 	searchWrap := container.New(layout.NewGridWrapLayout(fyne.NewSize(360, 40)), g.searchEntry)
@@ -704,6 +717,17 @@ func (g *GUI) applyFilters() {
 	g.populateBrowseGrid()
 }
 
+// scheduleApplyFilters debounces search input so the browse grid is rebuilt
+// once typing pauses instead of on every keystroke
+func (g *GUI) scheduleApplyFilters() {
+	if g.filterTimer != nil {
+		g.filterTimer.Stop()
+	}
+	g.filterTimer = time.AfterFunc(searchDebounce, func() {
+		fyne.Do(g.applyFilters)
+	})
+}
+
 func (g *GUI) clearBindings(view string) {
 	g.bindingsMu.Lock()
 	defer g.bindingsMu.Unlock()
@@ -1123,10 +1147,12 @@ func (g *GUI) runModpackOperation(mod Modpack, action PrimaryAction) {
 
 	go func(mod Modpack, action PrimaryAction) {
 		g.setRunningModpackID(mod.ID)
-		go g.monitorProcessStart(mod)
+		done := make(chan struct{})
+		go g.monitorProcessStart(mod, done)
 
 		runLauncherLogic(g.root, g.exePath, mod, g.prismProcess, progressCb)
 
+		close(done)
 		g.setRunningModpackID("")
 
 		g.processMu.Lock()
@@ -1156,13 +1182,18 @@ func (g *GUI) runModpackOperation(mod Modpack, action PrimaryAction) {
 	}(mod, action)
 }
 
-func (g *GUI) monitorProcessStart(mod Modpack) {
+// monitorProcessStart waits for Prism to start for mod. done is closed when
+// the launcher operation returns, so the loop doesn't have to re-check the
+// running modpack under its lock on every tick.
+func (g *GUI) monitorProcessStart(mod Modpack, done <-chan struct{}) {
 	ticker := time.NewTicker(500 * time.Millisecond)
 	defer ticker.Stop()
 
-	for range ticker.C {
-		if g.getRunningModpackID() != mod.ID {
+	for {
+		select {
+		case <-done:
 			return
+		case <-ticker.C:
 		}
 
 		proc := g.getPrismProcess()
@@ -1170,6 +1201,11 @@ func (g *GUI) monitorProcessStart(mod Modpack) {
 			continue
 		}
 
+		// The instance may have been killed or replaced in the meantime
+		if g.getRunningModpackID() != mod.ID {
+			return
+		}
+
 		g.setModpackState(mod.ID, func(state *ModpackState) {
 			state.Running = true
 			state.Busy = false
@@ -1273,9 +1309,11 @@ func (g *GUI) killRunningInstance(mod Modpack) {
 	})
 
 	// Remove from registry if it was a reattached process
-	if processID != "" && g.processRegistry != nil {
-		if err := g.processRegistry.RemoveRecord(processID); err != nil {
-			logf("Warning: Failed to remove process record: %v", err)
+	if processID != "" {
+		if registry := g.registry(); registry != nil {
+			if err := registry.RemoveRecord(processID); err != nil {
+				logf("Warning: Failed to remove process record: %v", err)
+			}
 		}
 	}
 
@@ -1289,13 +1327,14 @@ func (g *GUI) killRunningInstance(mod Modpack) {
 
 // reattachToProcess reattaches to an existing running process
 func (g *GUI) reattachToProcess(mod Modpack, processID string) {
-	if g.processRegistry == nil {
+	registry := g.registry()
+	if registry == nil {
 		g.updateStatus("Process registry not available")
 		return
 	}
 
 	// Get the process record
-	record, err := g.processRegistry.GetRecord(processID)
+	record, err := registry.GetRecord(processID)
 	if err != nil {
 		logf("%s", warnLine(fmt.Sprintf("Failed to get process record %s: %v", processID, err)))
 		g.updateStatus("Process not found in registry")
@@ -1313,7 +1352,7 @@ func (g *GUI) reattachToProcess(mod Modpack, processID string) {
 	if !isValid {
 		logf("%s", warnLine(fmt.Sprintf("Process %d no longer matches expected identity", record.PID)))
 		// Remove invalid record
-		if err := g.processRegistry.RemoveRecord(processID); err != nil {
+		if err := registry.RemoveRecord(processID); err != nil {
 			logf("Warning: Failed to remove invalid process record: %v", err)
 		}
 		// Update modpack state
@@ -1341,7 +1380,7 @@ func (g *GUI) reattachToProcess(mod Modpack, processID string) {
 	})
 
 	// Update last seen time
-	if err := g.processRegistry.UpdateProcessLastSeen(processID); err != nil {
+	if err := registry.UpdateProcessLastSeen(processID); err != nil {
 		logf("Warning: Failed to update process last seen time: %v", err)
 	}
 }
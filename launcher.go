@@ -5,10 +5,12 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"io/fs"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"runtime"
+	"sort"
 	"strconv"
 	"strings"
 	"time"
@@ -186,21 +188,20 @@ func fixQtPluginRPATH(prismDir string) error {
 	}
 
 	// Fix all .so files in plugins directory recursively as a fallback
-	err := filepath.Walk(pluginsDir, func(path string, info os.FileInfo, err error) error {
+	criticalPaths := criticalPluginPaths(pluginsDir, criticalPlugins)
+	err := filepath.WalkDir(pluginsDir, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// Skip directories and non-.so files
-		if info.IsDir() || !strings.HasSuffix(path, ".so") {
+		if d.IsDir() || !strings.HasSuffix(path, ".so") {
 			return nil
 		}
 
 		// Skip files we already processed
-		for _, plugin := range criticalPlugins {
-			if strings.HasSuffix(path, plugin) {
-				return nil
-			}
+		if _, ok := criticalPaths[path]; ok {
+			return nil
 		}
 
 		// Calculate relative path from plugin to lib directory
@@ -241,18 +242,35 @@ func fixQtPluginRPATH(prismDir string) error {
 	return nil
 }
 
+// criticalPluginPaths joins the critical plugin names onto pluginsDir once, so
+// directory walks can skip them with a map lookup per file instead of
+// suffix-matching every name against the whole list
+func criticalPluginPaths(pluginsDir string, plugins []string) map[string]struct{} {
+	paths := make(map[string]struct{}, len(plugins))
+	for _, plugin := range plugins {
+		paths[filepath.Join(pluginsDir, plugin)] = struct{}{}
+	}
+	return paths
+}
+
 // fixPluginPermissions fixes permissions for all .so files in the plugins directory
 func fixPluginPermissions(pluginsDir string) error {
-	return filepath.Walk(pluginsDir, func(path string, info os.FileInfo, err error) error {
+	return filepath.WalkDir(pluginsDir, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// Skip directories and non-.so files
-		if info.IsDir() || !strings.HasSuffix(path, ".so") {
+		if d.IsDir() || !strings.HasSuffix(path, ".so") {
 			return nil
 		}
 
+		// Only stat the plugin files themselves, not every directory entry
+		info, err := d.Info()
+		if err != nil {
+			return err
+		}
+
 		// Set execute permissions (755) for plugin files
 		currentMode := info.Mode()
 		newMode := currentMode | 0111 // Add execute bit for owner, group, and others
@@ -317,10 +335,39 @@ func isSharedLibrary(filePath string) bool {
 		strings.Contains(outputStr, "dynamically linked")
 }
 
-// checkPluginDependencies checks if plugins are valid shared libraries and can find their dependencies
-func checkPluginDependencies(prismDir string) error {
+// inspectPlugin runs the file-type check and ldd for a plugin side by side.
+// The two helpers don't depend on each other, so ldd is started before the
+// file check and only waited on afterwards. ldd's stderr is discarded.
+func inspectPlugin(pluginPath string, withLdd bool) (valid bool, lddOutput []byte, lddErr error) {
+	var lddCmd *exec.Cmd
+	var lddBuf bytes.Buffer
+	if withLdd {
+		lddCmd = exec.Command("ldd", pluginPath)
+		lddCmd.Stdout = &lddBuf
+		if lddErr = lddCmd.Start(); lddErr != nil {
+			lddCmd = nil
+		}
+	}
+
+	valid = isSharedLibrary(pluginPath)
+
+	if lddCmd != nil {
+		lddErr = lddCmd.Wait()
+	}
+	return valid, lddBuf.Bytes(), lddErr
+}
+
+// errPluginCheckSkipped is returned by checkPluginDependencies when the plugins can't be checked at
+// all (no plugins directory, no plugins, or no ldd). It has already been reported as a warning; the
+// result just must not be recorded as a clean check.
+var errPluginCheckSkipped = errors.New("plugin dependency check skipped")
+
+// checkPluginDependencies checks if plugins are valid shared libraries and can find their dependencies.
+// Only a fully clean check returns a nil error, together with every file it relied on: the plugins
+// themselves and the libraries ldd resolved for them.
+func checkPluginDependencies(prismDir string) ([]string, error) {
 	if runtime.GOOS != "linux" {
-		return nil
+		return nil, nil
 	}
 
 	logf("%s", stepLine("Checking plugin dependencies"))
@@ -331,7 +378,7 @@ func checkPluginDependencies(prismDir string) error {
 
 	if !exists(pluginsDir) {
 		logf("%s", warnLine("Plugins directory not found, skipping dependency checking"))
-		return nil
+		return nil, errPluginCheckSkipped
 	}
 
 	// Check critical plugins
@@ -343,6 +390,8 @@ func checkPluginDependencies(prismDir string) error {
 
 	var invalidPlugins []string
 	var missingDeps []string
+	var uncheckedPlugins []string
+	var checkedFiles []string
 	var checkedPlugins int
 	var validPlugins int
 
@@ -359,8 +408,9 @@ func checkPluginDependencies(prismDir string) error {
 			checkedPlugins++
 			logf("Checking plugin: %s", plugin)
 
-			// First validate that it's a proper shared library
-			if !isSharedLibrary(pluginPath) {
+			// Validate the library type and resolve dependencies concurrently
+			isLib, output, lddErr := inspectPlugin(pluginPath, lddAvailable)
+			if !isLib {
 				errMsg := fmt.Sprintf("%s: not a valid shared library (may be corrupted or wrong file type)", plugin)
 				invalidPlugins = append(invalidPlugins, errMsg)
 				logf("%s", warnLine(errMsg))
@@ -368,32 +418,25 @@ func checkPluginDependencies(prismDir string) error {
 			}
 
 			validPlugins++
+			checkedFiles = append(checkedFiles, pluginPath)
 			logf("Plugin %s: valid shared library", plugin)
 
 			// Only check dependencies if ldd is available
 			if lddAvailable {
 				logf("Checking dependencies for %s", plugin)
-				cmd := exec.Command("ldd", pluginPath)
-				output, err := cmd.Output()
-				if err != nil {
-					logf("%s", warnLine(fmt.Sprintf("Failed to check dependencies for %s: %v", plugin, err)))
+				if lddErr != nil {
+					uncheckedPlugins = append(uncheckedPlugins, plugin)
+					logf("%s", warnLine(fmt.Sprintf("Failed to check dependencies for %s: %v", plugin, lddErr)))
 					continue
 				}
 
 				// Parse ldd output for missing dependencies
-				lines := strings.Split(string(output), "\n")
-				for _, line := range lines {
-					line = strings.TrimSpace(line)
-					if strings.Contains(line, "not found") {
-						// Extract the library name
-						parts := strings.Fields(line)
-						if len(parts) > 0 {
-							missingLib := parts[0]
-							missingDeps = append(missingDeps, fmt.Sprintf("%s: %s", plugin, missingLib))
-							logf("%s", warnLine(fmt.Sprintf("Missing dependency for %s: %s", plugin, missingLib)))
-						}
-					}
+				missing, resolved := parseLddOutput(output)
+				for _, missingLib := range missing {
+					missingDeps = append(missingDeps, fmt.Sprintf("%s: %s", plugin, missingLib))
+					logf("%s", warnLine(fmt.Sprintf("Missing dependency for %s: %s", plugin, missingLib)))
 				}
+				checkedFiles = append(checkedFiles, resolved...)
 			}
 		} else {
 			logf("Plugin not found: %s (skipping dependency check)", plugin)
@@ -401,29 +444,29 @@ func checkPluginDependencies(prismDir string) error {
 	}
 
 	// Check all .so files in plugins directory recursively
-	err := filepath.Walk(pluginsDir, func(path string, info os.FileInfo, err error) error {
+	criticalPaths := criticalPluginPaths(pluginsDir, criticalPlugins)
+	err := filepath.WalkDir(pluginsDir, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// Skip directories and non-.so files
-		if info.IsDir() || !strings.HasSuffix(path, ".so") {
+		if d.IsDir() || !strings.HasSuffix(path, ".so") {
 			return nil
 		}
 
 		// Skip files we already processed
-		for _, plugin := range criticalPlugins {
-			if strings.HasSuffix(path, plugin) {
-				return nil
-			}
+		if _, ok := criticalPaths[path]; ok {
+			return nil
 		}
 
 		checkedPlugins++
 		pluginName := filepath.Base(path)
 		logf("Checking additional plugin: %s", pluginName)
 
-		// First validate that it's a proper shared library
-		if !isSharedLibrary(path) {
+		// Validate the library type and resolve dependencies concurrently
+		isLib, output, lddErr := inspectPlugin(path, lddAvailable)
+		if !isLib {
 			errMsg := fmt.Sprintf("%s: not a valid shared library (may be corrupted or wrong file type)", pluginName)
 			invalidPlugins = append(invalidPlugins, errMsg)
 			logf("%s", warnLine(errMsg))
@@ -431,32 +474,25 @@ func checkPluginDependencies(prismDir string) error {
 		}
 
 		validPlugins++
+		checkedFiles = append(checkedFiles, path)
 		logf("Plugin %s: valid shared library", pluginName)
 
 		// Only check dependencies if ldd is available
 		if lddAvailable {
 			logf("Checking dependencies for %s", pluginName)
-			cmd := exec.Command("ldd", path)
-			output, err := cmd.Output()
-			if err != nil {
-				logf("%s", warnLine(fmt.Sprintf("Failed to check dependencies for %s: %v", pluginName, err)))
+			if lddErr != nil {
+				uncheckedPlugins = append(uncheckedPlugins, pluginName)
+				logf("%s", warnLine(fmt.Sprintf("Failed to check dependencies for %s: %v", pluginName, lddErr)))
 				return nil
 			}
 
 			// Parse ldd output for missing dependencies
-			lines := strings.Split(string(output), "\n")
-			for _, line := range lines {
-				line = strings.TrimSpace(line)
-				if strings.Contains(line, "not found") {
-					// Extract the library name
-					parts := strings.Fields(line)
-					if len(parts) > 0 {
-						missingLib := parts[0]
-						missingDeps = append(missingDeps, fmt.Sprintf("%s: %s", pluginName, missingLib))
-						logf("%s", warnLine(fmt.Sprintf("Missing dependency for %s: %s", pluginName, missingLib)))
-					}
-				}
+			missing, resolved := parseLddOutput(output)
+			for _, missingLib := range missing {
+				missingDeps = append(missingDeps, fmt.Sprintf("%s: %s", pluginName, missingLib))
+				logf("%s", warnLine(fmt.Sprintf("Missing dependency for %s: %s", pluginName, missingLib)))
 			}
+			checkedFiles = append(checkedFiles, resolved...)
 		}
 
 		return nil
@@ -481,14 +517,108 @@ func checkPluginDependencies(prismDir string) error {
 		for _, dep := range missingDeps {
 			logf("  - %s", dep)
 		}
-		return fmt.Errorf("plugin dependencies missing: %s", strings.Join(missingDeps, "; "))
-	} else if validPlugins > 0 {
-		logf("%s", successLine(fmt.Sprintf("All %d plugins validated with resolved dependencies", validPlugins)))
-	} else {
+		return nil, fmt.Errorf("plugin dependencies missing: %s", strings.Join(missingDeps, "; "))
+	}
+
+	switch {
+	case len(invalidPlugins) > 0:
+		return nil, fmt.Errorf("%d invalid plugins found", len(invalidPlugins))
+	case err != nil:
+		return nil, fmt.Errorf("failed to check all plugins: %w", err)
+	case !lddAvailable:
+		return nil, errPluginCheckSkipped
+	case len(uncheckedPlugins) > 0:
+		return nil, fmt.Errorf("could not check dependencies for: %s", strings.Join(uncheckedPlugins, ", "))
+	case validPlugins == 0:
 		logf("%s", warnLine("No valid plugins found"))
+		return nil, errPluginCheckSkipped
 	}
 
-	return nil
+	logf("%s", successLine(fmt.Sprintf("All %d plugins validated with resolved dependencies", validPlugins)))
+	return checkedFiles, nil
+}
+
+// parseLddOutput splits ldd output into the names of libraries that could not
+// be found and the paths of the libraries that were resolved
+func parseLddOutput(output []byte) (missing, resolved []string) {
+	for _, line := range strings.Split(string(output), "\n") {
+		line = strings.TrimSpace(line)
+		if strings.Contains(line, "not found") {
+			// Extract the library name
+			if parts := strings.Fields(line); len(parts) > 0 {
+				missing = append(missing, parts[0])
+			}
+			continue
+		}
+
+		// "libfoo.so.1 => /usr/lib/libfoo.so.1 (0x...)" or "/lib64/ld-linux-x86-64.so.2 (0x...)"
+		if _, target, ok := strings.Cut(line, "=>"); ok {
+			line = strings.TrimSpace(target)
+		}
+		if parts := strings.Fields(line); len(parts) > 0 && filepath.IsAbs(parts[0]) {
+			resolved = append(resolved, parts[0])
+		}
+	}
+	return missing, resolved
+}
+
+// pluginCheckStampName is the file (inside the Prism directory) recording the
+// files a clean plugin dependency check relied on
+const pluginCheckStampName = ".plugin-check-stamp"
+
+// pluginFilesStamp describes files by path, size and modification time, one
+// per line in sorted order. It returns "" if any of them can't be stat'ed.
+func pluginFilesStamp(files []string) string {
+	sorted := append([]string(nil), files...)
+	sort.Strings(sorted)
+
+	var b strings.Builder
+	for i, path := range sorted {
+		if i > 0 && path == sorted[i-1] {
+			continue
+		}
+		info, err := os.Stat(path)
+		if err != nil {
+			return ""
+		}
+		fmt.Fprintf(&b, "%s\t%d\t%d\n", path, info.Size(), info.ModTime().UnixNano())
+	}
+	return b.String()
+}
+
+// pluginCheckUpToDate reports whether the stamp at stampPath still describes
+// the plugins currently in pluginsDir and the system libraries they resolved
+// to, i.e. whether a new ldd pass would check exactly the same files
+func pluginCheckUpToDate(pluginsDir, stampPath string) bool {
+	previous, err := os.ReadFile(stampPath)
+	if err != nil || len(previous) == 0 {
+		return false
+	}
+
+	// Plugins are listed from disk so added or removed ones are noticed;
+	// libraries outside the plugins directory come from the stamp itself
+	var files []string
+	err = filepath.WalkDir(pluginsDir, func(path string, d fs.DirEntry, err error) error {
+		if err != nil {
+			return err
+		}
+		if !d.IsDir() && strings.HasSuffix(path, ".so") {
+			files = append(files, path)
+		}
+		return nil
+	})
+	if err != nil {
+		return false
+	}
+	pluginsPrefix := pluginsDir + string(filepath.Separator)
+	for _, line := range strings.Split(strings.TrimSuffix(string(previous), "\n"), "\n") {
+		path, _, _ := strings.Cut(line, "\t")
+		if !strings.HasPrefix(path, pluginsPrefix) {
+			files = append(files, path)
+		}
+	}
+
+	return pluginFilesStamp(files) == string(previous)
 }
 
 // calculateRelativePath calculates the relative path from a plugin to the lib directory
@@ -758,7 +888,7 @@ exec "$PRISM_EXE" "$@"
 // launchPrismWithWrapper launches Prism using the wrapper script approach
 func launchPrismWithWrapper(prismDir, jreDir, instanceName string) error {
 	if runtime.GOOS != "linux" {
-		return fmt.Errorf("wrapper script approach only supported on Linux")
+		return errors.New("wrapper script approach only supported on Linux")
 	}
 
 	logf("%s", stepLine("Launching Prism using wrapper script approach"))
@@ -931,6 +1061,103 @@ func launchPrismGUIFallback(prismExe, prismDir, jreDir, packName string, prismPr
 
 // -------------------- Launcher Logic --------------------
 
+// setupResult is the outcome of a background setup task
+type setupResult struct {
+	downloaded bool
+	err        error
+}
+
+// startSetupTask runs task in its own goroutine and delivers its result on
+// the returned channel, which is closed afterwards so waiting on it again
+// never blocks
+func startSetupTask(task func() (bool, error)) <-chan setupResult {
+	result := make(chan setupResult, 1)
+	go func() {
+		downloaded, err := task()
+		result <- setupResult{downloaded: downloaded, err: err}
+		close(result)
+	}()
+	return result
+}
+
+// ensureJavaRuntime installs the Temurin JRE into jreDir unless it is already
+// present and reports whether a download was needed
+func ensureJavaRuntime(version, jreDir, javaBin, javawBin string) (bool, error) {
+	if exists(javaBin) && exists(javawBin) {
+		return false, nil
+	}
+
+	logf("%s", stepLine(fmt.Sprintf("Installing Temurin JRE %s", version)))
+	jreURL, err := fetchJREURL(version)
+	if err != nil {
+		return false, fmt.Errorf("failed to resolve Java %s download: %w", version, err)
+	}
+
+	// Extract into a staging directory and move it into place only once it
+	// is complete, so an interrupted install never leaves a jreDir whose
+	// bin/java makes later runs think Java is already installed
+	stagingDir := jreDir + ".partial"
+	if err := os.RemoveAll(stagingDir); err != nil {
+		return false, err
+	}
+	if err := downloadAndUnzipTo(jreURL, stagingDir); err != nil {
+		_ = os.RemoveAll(stagingDir)
+		return false, err
+	}
+	_ = flattenJREExtraction(stagingDir)
+
+	stagedBinDir := filepath.Join(stagingDir, "bin")
+	if !exists(filepath.Join(stagedBinDir, JavaBinName)) || !exists(filepath.Join(stagedBinDir, JavawBinName)) {
+		_ = os.RemoveAll(stagingDir)
+		return false, fmt.Errorf("Java %s installation looks incomplete (bin/%s or bin/%s not found)", version, JavaBinName, JavawBinName)
+	}
+
+	// Replace any leftover from an older, incomplete install
+	if err := os.RemoveAll(jreDir); err != nil {
+		return false, err
+	}
+	if err := os.Rename(stagingDir, jreDir); err != nil {
+		_ = os.RemoveAll(stagingDir)
+		return false, err
+	}
+	return true, nil
+}
+
+// ensurePackwizBootstrap downloads the packwiz bootstrap (native or jar)
+// unless one is already present and reports whether a download was needed
+func ensurePackwizBootstrap(bootstrapExe, bootstrapJar string) (bool, error) {
+	if exists(bootstrapExe) || exists(bootstrapJar) {
+		return false, nil
+	}
+
+	pwURL, err := fetchPackwizBootstrapURL()
+	if err != nil {
+		return false, fmt.Errorf("failed to resolve packwiz bootstrap: %w", err)
+	}
+	target := bootstrapExe
+	if strings.HasSuffix(strings.ToLower(pwURL), ".jar") {
+		target = bootstrapJar
+	}
+	if err := downloadTo(pwURL, target, 0755); err != nil {
+		return false, err
+	}
+	return true, nil
+}
+
+// ensurePackwizInstaller downloads packwiz-installer.jar unless it is already
+// present and reports whether a download was needed
+func ensurePackwizInstaller(mainJarPath string) (bool, error) {
+	if exists(mainJarPath) {
+		return false, nil
+	}
+
+	logf("%s", stepLine("Downloading packwiz-installer.jar"))
+	if err := downloadPackwizInstaller(mainJarPath); err != nil {
+		return false, fmt.Errorf("failed to download packwiz-installer.jar: %w", err)
+	}
+	return true, nil
+}
+
 func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.Process, progressCb func(stage string, step, total int)) {
 	packName := modpackLabel(modpack)
 	// Note: Update check already happened at startup in main()
@@ -968,10 +1195,12 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 	// Determine required Java version based on Minecraft version
 	requiredJavaVersion := getJavaVersionForMinecraft(packInfo.Minecraft)
 	jreDir := filepath.Join(prismJavaDir, "jre"+requiredJavaVersion)
-	javaBin := filepath.Join(jreDir, "bin", JavaBinName)
-	javawBin := filepath.Join(jreDir, "bin", JavawBinName)
+	jreBinDir := filepath.Join(jreDir, "bin")
+	javaBin := filepath.Join(jreBinDir, JavaBinName)
+	javawBin := filepath.Join(jreBinDir, JavawBinName)
 	bootstrapExe := filepath.Join(utilDir, "packwiz-installer-bootstrap"+getExecutableExtension())
 	bootstrapJar := filepath.Join(utilDir, "packwiz-installer-bootstrap.jar")
+	mainJarPath := filepath.Join(utilDir, "packwiz-installer.jar")
 
 	// Create util directory for miscellaneous files
 	if err := os.MkdirAll(utilDir, 0755); err != nil {
@@ -988,7 +1217,9 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 	report("Ensuring Prism Launcher")
 	logf("%s", stepLine("Ensuring Prism Launcher portable build"))
 
-	// Check and install Qt dependencies if needed (Linux only)
+	// Check and install Qt dependencies if needed (Linux only). This may
+	// prompt on stdin and run sudo, so it happens before any background
+	// download starts writing to the terminal.
 	if runtime.GOOS == "linux" {
 		logf("%s", stepLine("Checking Qt dependencies"))
 		if err := ensureQtDependencies(); err != nil {
@@ -998,30 +1229,44 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 		}
 	}
 
+	// The Java runtime and packwiz tools don't depend on Prism or on each
+	// other, so download them in the background while Prism is prepared and
+	// collect each result at its own step
+	javaResult := startSetupTask(func() (bool, error) {
+		return ensureJavaRuntime(requiredJavaVersion, jreDir, javaBin, javawBin)
+	})
+	bootstrapResult := startSetupTask(func() (bool, error) {
+		return ensurePackwizBootstrap(bootstrapExe, bootstrapJar)
+	})
+	installerResult := startSetupTask(func() (bool, error) {
+		return ensurePackwizInstaller(mainJarPath)
+	})
+
+	// failSetup waits for the background tasks before exiting, so fail()
+	// never interrupts a download that is still writing files
+	failSetup := func(err error) {
+		for _, res := range []<-chan setupResult{javaResult, bootstrapResult, installerResult} {
+			<-res
+		}
+		fail(err)
+	}
+
 	prismDownloaded, err := ensurePrism(prismDir)
 	if err != nil {
-		fail(err)
+		failSetup(err)
 	}
 	if prismDownloaded {
 		logf("%s", successLine("Prism Launcher downloaded"))
+		// Fresh plugins always get a full dependency check before launch
+		_ = os.Remove(filepath.Join(prismDir, pluginCheckStampName))
 	} else {
 		logf("%s", successLine("Prism Launcher ready"))
 	}
 
 	report("Ensuring Java runtime")
-	if !exists(javaBin) || !exists(javawBin) {
-		logf("%s", stepLine(fmt.Sprintf("Installing Temurin JRE %s", requiredJavaVersion)))
-		jreURL, err := fetchJREURL(requiredJavaVersion)
-		if err != nil {
-			fail(fmt.Errorf("failed to resolve Java %s download: %w", requiredJavaVersion, err))
-		}
-		if err := downloadAndUnzipTo(jreURL, jreDir); err != nil {
-			fail(err)
-		}
-		_ = flattenJREExtraction(jreDir)
-		if !exists(javaBin) || !exists(javawBin) {
-			fail(fmt.Errorf("Java %s installation looks incomplete (bin/%s or bin/%s not found)", requiredJavaVersion, JavaBinName, JavawBinName))
-		}
+	if res := <-javaResult; res.err != nil {
+		failSetup(res.err)
+	} else if res.downloaded {
 		logf("%s", successLine(fmt.Sprintf("Java %s installed", requiredJavaVersion)))
 	} else {
 		logf("%s", successLine(fmt.Sprintf("Java %s already installed", requiredJavaVersion)))
@@ -1029,18 +1274,9 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 
 	report("Ensuring packwiz bootstrap")
 	logf("%s", stepLine("Ensuring packwiz bootstrap"))
-	if !exists(bootstrapExe) && !exists(bootstrapJar) {
-		pwURL, err := fetchPackwizBootstrapURL()
-		if err != nil {
-			fail(fmt.Errorf("failed to resolve packwiz bootstrap: %w", err))
-		}
-		target := bootstrapExe
-		if strings.HasSuffix(strings.ToLower(pwURL), ".jar") {
-			target = bootstrapJar
-		}
-		if err := downloadTo(pwURL, target, 0755); err != nil {
-			fail(err)
-		}
+	if res := <-bootstrapResult; res.err != nil {
+		failSetup(res.err)
+	} else if res.downloaded {
 		logf("%s", successLine("Packwiz bootstrap installed"))
 	} else {
 		logf("%s", successLine("Packwiz bootstrap already installed"))
@@ -1050,7 +1286,7 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 	instDir := filepath.Join(prismDir, "instances", modpack.InstanceName)
 	mcDir := filepath.Join(instDir, "minecraft") // Use minecraft, not .minecraft
 	if err := os.MkdirAll(mcDir, 0755); err != nil {
-		fail(err)
+		failSetup(err)
 	}
 
 	logf("%s", sectionLine("Instance Setup"))
@@ -1063,7 +1299,7 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 	if needsInstanceCreation {
 		logf("%s", stepLine(fmt.Sprintf("Creating Prism instance structure with %s %s", packInfo.ModLoader, packInfo.LoaderVersion)))
 		if err := createMultiMCInstance(modpack, packInfo, instDir, javawBin); err != nil {
-			fail(fmt.Errorf("failed to create MultiMC instance: %w", err))
+			failSetup(fmt.Errorf("failed to create MultiMC instance: %w", err))
 		}
 		logf("%s", successLine("Instance structure ready"))
 	} else {
@@ -1083,7 +1319,7 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 	if !modloaderInstalled {
 		logf("%s", stepLine(fmt.Sprintf("Installing %s %s", packInfo.ModLoader, packInfo.LoaderVersion)))
 		if err := installModLoaderForInstance(instDir, javaBin, packInfo); err != nil {
-			fail(fmt.Errorf("failed to install %s: %w", packInfo.ModLoader, err))
+			failSetup(fmt.Errorf("failed to install %s: %w", packInfo.ModLoader, err))
 		}
 		logf("%s", successLine(fmt.Sprintf("%s ready", strings.Title(packInfo.ModLoader))))
 	} else {
@@ -1146,28 +1382,29 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 	}()
 
 	// Ensure packwiz-installer.jar is available
-	mainJarPath := filepath.Join(utilDir, "packwiz-installer.jar")
-	if !exists(mainJarPath) {
-		logf("%s", stepLine("Downloading packwiz-installer.jar"))
-		if err := downloadPackwizInstaller(mainJarPath); err != nil {
-			fail(fmt.Errorf("failed to download packwiz-installer.jar: %w", err))
-		}
+	if res := <-installerResult; res.err != nil {
+		failSetup(res.err)
+	} else if res.downloaded {
 		logf("%s", successLine("packwiz-installer.jar downloaded"))
 	}
 
+	// Arguments and environment are shared by the first run and the retry
+	packwizArgs := []string{"--bootstrap-no-update", "--bootstrap-main-jar", mainJarPath, "-g", packURL}
+	packwizEnv := append(os.Environ(),
+		"JAVA_HOME="+jreDir,
+		"PATH="+BuildPathEnv(jreBinDir),
+	)
+
 	var cmd *exec.Cmd
 	if exists(bootstrapExe) {
-		cmd = exec.Command(bootstrapExe, "--bootstrap-no-update", "--bootstrap-main-jar", mainJarPath, "-g", packURL) // run from minecraft directory
+		cmd = exec.Command(bootstrapExe, packwizArgs...) // run from minecraft directory
 	} else if exists(bootstrapJar) {
-		cmd = exec.Command(javaBin, "-jar", bootstrapJar, "--bootstrap-no-update", "--bootstrap-main-jar", mainJarPath, "-g", packURL)
+		cmd = exec.Command(javaBin, append([]string{"-jar", bootstrapJar}, packwizArgs...)...)
 	} else {
 		fail(errors.New("packwiz bootstrap not found after download"))
 	}
 	cmd.Dir = mcDir // critical: minecraft directory so packwiz installs mods in correct place
-	cmd.Env = append(os.Environ(),
-		"JAVA_HOME="+jreDir,
-		"PATH="+BuildPathEnv(filepath.Join(jreDir, "bin")),
-	)
+	cmd.Env = packwizEnv
 
 	// Set platform-specific process attributes
 	setPackwizProcessAttributes(cmd)
@@ -1186,16 +1423,13 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 			// Retry ONCE after user saves files, but create a new command to avoid "already started" error
 			var retryCmd *exec.Cmd
 			if exists(bootstrapExe) {
-				retryCmd = exec.Command(bootstrapExe, "--bootstrap-no-update", "--bootstrap-main-jar", mainJarPath, "-g", packURL)
+				retryCmd = exec.Command(bootstrapExe, packwizArgs...)
 			} else if exists(bootstrapJar) {
-				retryCmd = exec.Command(javaBin, "-jar", bootstrapJar, "--bootstrap-no-update", "--bootstrap-main-jar", mainJarPath, "-g", packURL)
+				retryCmd = exec.Command(javaBin, append([]string{"-jar", bootstrapJar}, packwizArgs...)...)
 			}
 			if retryCmd != nil {
 				retryCmd.Dir = mcDir // also run from minecraft directory
-				retryCmd.Env = append(os.Environ(),
-					"JAVA_HOME="+jreDir,
-					"PATH="+BuildPathEnv(filepath.Join(jreDir, "bin")),
-				)
+				retryCmd.Env = packwizEnv
 
 				// Set platform-specific process attributes for retry
 				setPackwizRetryProcessAttributes(retryCmd)
@@ -1276,11 +1510,21 @@ func runLauncherLogic(root, exePath string, modpack Modpack, prismProcess **os.P
 		}
 	}
 
-	// Check plugin dependencies before launching
+	// Check plugin dependencies before launching, unless neither the plugins
+	// nor the libraries they resolved to have changed since the last clean check
 	if runtime.GOOS == "linux" {
-		if err := checkPluginDependencies(prismDir); err != nil {
-			logf("%s", warnLine(fmt.Sprintf("Plugin dependency check failed: %v", err)))
-			// Don't fail the launch, but warn the user
+		stampPath := filepath.Join(prismDir, pluginCheckStampName)
+		pluginsDir := filepath.Join(getPrismBaseDir(prismDir), "plugins")
+		if pluginCheckUpToDate(pluginsDir, stampPath) {
+			logf("%s", successLine("Plugins and their libraries unchanged since last dependency check"))
+		} else if checkedFiles, err := checkPluginDependencies(prismDir); err != nil {
+			_ = os.Remove(stampPath)
+			if !errors.Is(err, errPluginCheckSkipped) {
+				logf("%s", warnLine(fmt.Sprintf("Plugin dependency check failed: %v", err)))
+				// Don't fail the launch, but warn the user
+			}
+		} else if stamp := pluginFilesStamp(checkedFiles); stamp != "" {
+			_ = os.WriteFile(stampPath, []byte(stamp), 0644)
 		}
 	}
 
@@ -0,0 +1,101 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"reflect"
+	"testing"
+	"time"
+)
+
+// TestParseLddOutput verifies missing and resolved libraries are extracted from ldd output
+func TestParseLddOutput(t *testing.T) {
+	output := []byte(`	linux-vdso.so.1 (0x00007ffd)
+	libQt6Gui.so.6 => /opt/prism/lib/libQt6Gui.so.6 (0x00007f10)
+	libxcb-cursor.so.0 => not found
+	libc.so.6 => /lib/x86_64-linux-gnu/libc.so.6 (0x00007f20)
+	/lib64/ld-linux-x86-64.so.2 (0x00007f30)
+`)
+
+	missing, resolved := parseLddOutput(output)
+
+	if want := []string{"libxcb-cursor.so.0"}; !reflect.DeepEqual(missing, want) {
+		t.Errorf("missing = %v, want %v", missing, want)
+	}
+	wantResolved := []string{
+		"/opt/prism/lib/libQt6Gui.so.6",
+		"/lib/x86_64-linux-gnu/libc.so.6",
+		"/lib64/ld-linux-x86-64.so.2",
+	}
+	if !reflect.DeepEqual(resolved, wantResolved) {
+		t.Errorf("resolved = %v, want %v", resolved, wantResolved)
+	}
+}
+
+// TestPluginCheckUpToDate verifies the stamp notices changes to plugins and resolved libraries
+func TestPluginCheckUpToDate(t *testing.T) {
+	tempDir := t.TempDir()
+	pluginsDir := filepath.Join(tempDir, "plugins")
+	platformsDir := filepath.Join(pluginsDir, "platforms")
+	if err := os.MkdirAll(platformsDir, 0755); err != nil {
+		t.Fatalf("Failed to create plugins directory: %v", err)
+	}
+
+	plugin := filepath.Join(platformsDir, "libqxcb.so")
+	systemLib := filepath.Join(tempDir, "libxcb.so.1")
+	for _, path := range []string{plugin, systemLib} {
+		if err := os.WriteFile(path, []byte("elf"), 0755); err != nil {
+			t.Fatalf("Failed to write %s: %v", path, err)
+		}
+	}
+
+	stampPath := filepath.Join(tempDir, pluginCheckStampName)
+	if pluginCheckUpToDate(pluginsDir, stampPath) {
+		t.Fatal("Expected a missing stamp to require a check")
+	}
+
+	writeStamp := func() {
+		stamp := pluginFilesStamp([]string{plugin, systemLib, systemLib})
+		if stamp == "" {
+			t.Fatal("Expected a non-empty stamp")
+		}
+		if err := os.WriteFile(stampPath, []byte(stamp), 0644); err != nil {
+			t.Fatalf("Failed to write stamp: %v", err)
+		}
+	}
+	writeStamp()
+	if !pluginCheckUpToDate(pluginsDir, stampPath) {
+		t.Fatal("Expected an unchanged tree to skip the check")
+	}
+
+	// A plugin rewritten inside a subdirectory (e.g. by patchelf)
+	later := time.Now().Add(time.Minute)
+	if err := os.Chtimes(plugin, later, later); err != nil {
+		t.Fatalf("Failed to touch plugin: %v", err)
+	}
+	if pluginCheckUpToDate(pluginsDir, stampPath) {
+		t.Error("Expected a modified plugin to require a check")
+	}
+
+	// A newly added plugin
+	writeStamp()
+	extra := filepath.Join(platformsDir, "libqwayland.so")
+	if err := os.WriteFile(extra, []byte("elf"), 0755); err != nil {
+		t.Fatalf("Failed to write extra plugin: %v", err)
+	}
+	if pluginCheckUpToDate(pluginsDir, stampPath) {
+		t.Error("Expected an added plugin to require a check")
+	}
+	if err := os.Remove(extra); err != nil {
+		t.Fatalf("Failed to remove extra plugin: %v", err)
+	}
+
+	// A system library that disappeared outside the Prism directory
+	writeStamp()
+	if err := os.Remove(systemLib); err != nil {
+		t.Fatalf("Failed to remove system library: %v", err)
+	}
+	if pluginCheckUpToDate(pluginsDir, stampPath) {
+		t.Error("Expected a removed system library to require a check")
+	}
+}
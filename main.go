@@ -49,7 +49,7 @@ func main() {
 	// Platform check now handled by platform abstraction
 	// Windows hard block removed for cross-platform support
 
-	root := getLauncherHome()
+	root := cachedLauncherHome()
 
 	// Set up emergency crash logger BEFORE anything else that might crash
 	setupEmergencyCrashLogger(root)
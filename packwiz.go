@@ -409,11 +409,10 @@ func restoreModpackBackup(mp Modpack, backupPath, mcDir string) error {
 	// Remove current modpack directories
 	dirsToRemove := []string{"mods", "config", "resourcepacks", "shaderpacks"}
 	for _, dir := range dirsToRemove {
+		// RemoveAll already treats a missing directory as success
 		dirPath := filepath.Join(mcDir, dir)
-		if exists(dirPath) {
-			if err := os.RemoveAll(dirPath); err != nil {
-				logf("%s", warnLine(fmt.Sprintf("Failed to remove %s during restore: %v", dir, err)))
-			}
+		if err := os.RemoveAll(dirPath); err != nil {
+			logf("%s", warnLine(fmt.Sprintf("Failed to remove %s during restore: %v", dir, err)))
 		}
 	}
 
@@ -5,6 +5,7 @@ import (
 	"path/filepath"
 	"runtime"
 	"strings"
+	"sync"
 )
 
 // Platform-specific constants
@@ -118,6 +119,20 @@ func getPrismBaseDir(prismDir string) string {
 	return baseDir
 }
 
+var (
+	launcherHomeOnce sync.Once
+	launcherHome     string
+)
+
+// cachedLauncherHome returns getLauncherHome(), resolving it only once per run.
+// On Windows the lookup reads the registry, so repeat callers share the result.
+func cachedLauncherHome() string {
+	launcherHomeOnce.Do(func() {
+		launcherHome = getLauncherHome()
+	})
+	return launcherHome
+}
+
 // getPathSeparator returns the platform-specific PATH separator
 func getPathSeparator() string {
 	if runtime.GOOS == "windows" {
@@ -136,7 +151,7 @@ func BuildPathEnv(additionalPath string) string {
 func GetPrismConfigDir() string {
 	if runtime.GOOS == "windows" {
 		// Use our launcher directory for Windows portable
-		return getLauncherHome()
+		return cachedLauncherHome()
 	}
 	// macOS/Linux: use Prism's standard config directory
 	if runtime.GOOS == "darwin" {
@@ -154,7 +169,7 @@ func GetPrismConfigDir() string {
 func GetPrismDataDir() string {
 	if runtime.GOOS == "windows" {
 		// Use our launcher directory for Windows portable
-		return getLauncherHome()
+		return cachedLauncherHome()
 	}
 	// macOS/Linux: use Prism's standard data directory
 	if runtime.GOOS == "darwin" {
@@ -4,6 +4,7 @@
 package main
 
 import (
+	"errors"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -71,6 +72,12 @@ func setExecutablePermissions(path string) error {
 	return os.Chmod(path, 0755)
 }
 
+// macOS file cloning (clonefile only works on paths that don't exist yet,
+// so open descriptors always use the regular copy path)
+func cloneFile(dst, src *os.File) error {
+	return errors.ErrUnsupported
+}
+
 // macOS architecture detection
 func getArchitecture() string {
 	switch runtime.GOARCH {
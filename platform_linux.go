@@ -10,6 +10,8 @@ import (
 	"runtime"
 	"strconv"
 	"strings"
+
+	"golang.org/x/sys/unix"
 )
 
 // Linux memory detection using /proc/meminfo
@@ -88,6 +90,13 @@ func setExecutablePermissions(path string) error {
 	return os.Chmod(path, 0755)
 }
 
+// Linux file cloning via the FICLONE ioctl. On reflink-capable filesystems
+// (btrfs, XFS, bcachefs) this shares the source extents instead of copying
+// data; everywhere else it fails and the caller falls back to a regular copy.
+func cloneFile(dst, src *os.File) error {
+	return unix.IoctlFileClone(int(dst.Fd()), int(src.Fd()))
+}
+
 // Linux architecture detection
 func getArchitecture() string {
 	switch runtime.GOARCH {
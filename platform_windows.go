@@ -4,6 +4,7 @@
 package main
 
 import (
+	"errors"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -146,3 +147,8 @@ func setExecutablePermissions(path string) error {
 	// Windows doesn't have executable permissions in the same way as Unix
 	return nil
 }
+
+// Windows file cloning (block cloning is ReFS-only, so always use the regular copy path)
+func cloneFile(dst, src *os.File) error {
+	return errors.ErrUnsupported
+}
@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"io/fs"
 	"net/http"
 	"os"
 	"path/filepath"
@@ -56,11 +57,11 @@ func ensurePrism(dir string) (bool, error) {
 			return false, err
 		}
 
-		filepath.Walk(tempDir, func(path string, info os.FileInfo, err error) error {
+		filepath.WalkDir(tempDir, func(path string, d fs.DirEntry, err error) error {
 			if err != nil {
 				return err
 			}
-			if !info.IsDir() {
+			if !d.IsDir() {
 				relPath, _ := filepath.Rel(tempDir, path)
 				logf("  %s", relPath)
 			}
@@ -83,7 +84,7 @@ func ensurePrism(dir string) (bool, error) {
 		}
 
 		if tempAppPath == "" {
-			return false, fmt.Errorf("PrismLauncher.app not found in downloaded archive")
+			return false, errors.New("PrismLauncher.app not found in downloaded archive")
 		}
 
 		// Use the naming convention that matches the downloaded archive
@@ -398,16 +399,21 @@ func fixMacOSExecutablePermissions(appBundlePath string) error {
 	}
 
 	// Walk through all files in the MacOS directory and fix executable permissions
-	return filepath.Walk(macOSDir, func(path string, info os.FileInfo, err error) error {
+	return filepath.WalkDir(macOSDir, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// Skip directories
-		if info.IsDir() {
+		if d.IsDir() {
 			return nil
 		}
 
+		info, err := d.Info()
+		if err != nil {
+			return err
+		}
+
 		// Check if file is executable (has execute bit already or is a known executable type)
 		isExecutable := (info.Mode().Perm() & 0111) != 0 // Has any execute bit
 
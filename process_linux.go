@@ -4,6 +4,7 @@
 package main
 
 import (
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -204,13 +205,13 @@ func validateProcessIdentity(pid int, expectedExecutable, expectedWorkingDir str
 
 	lines := strings.Split(strings.TrimSpace(string(output)), "\n")
 	if len(lines) < 1 {
-		return false, fmt.Errorf("process not found")
+		return false, errors.New("process not found")
 	}
 
 	// Parse ps output (format: command\ncwd)
 	parts := strings.Split(lines[0], "\n")
 	if len(parts) < 2 {
-		return false, fmt.Errorf("invalid process information format")
+		return false, errors.New("invalid process information format")
 	}
 
 	actualCommand := strings.TrimSpace(parts[0])
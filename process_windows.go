@@ -4,6 +4,7 @@
 package main
 
 import (
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -136,7 +137,7 @@ func validateProcessIdentity(pid int, expectedExecutable, expectedWorkingDir str
 			// PowerShell succeeded, continue with validation
 		} else {
 			// PowerShell returned empty result, try wmic fallback
-			err = fmt.Errorf("PowerShell returned empty result")
+			err = errors.New("PowerShell returned empty result")
 		}
 	} else {
 		// PowerShell failed, try wmic fallback
@@ -169,13 +170,13 @@ func validateProcessIdentity(pid int, expectedExecutable, expectedWorkingDir str
 			outputStr := strings.TrimSpace(string(tasklistOutput))
 			if outputStr == "" {
 				// Empty output likely means process doesn't exist
-				return false, fmt.Errorf("process not found (may have exited)")
+				return false, errors.New("process not found (may have exited)")
 			}
 
 			// Check for "No tasks" message
 			if strings.Contains(strings.ToLower(outputStr), "no tasks") ||
 				strings.Contains(strings.ToLower(outputStr), "not found") {
-				return false, fmt.Errorf("process not found in tasklist output (may have exited)")
+				return false, errors.New("process not found in tasklist output (may have exited)")
 			}
 
 			lines := strings.Split(outputStr, "\n")
@@ -196,18 +197,18 @@ func validateProcessIdentity(pid int, expectedExecutable, expectedWorkingDir str
 			if actualExecutable == "" {
 				// If we get here, it means no process was found in tasklist output
 				// This could be because the process exited or because tasklist returned "INFO: No tasks..."
-				return false, fmt.Errorf("process not found in tasklist output (may have exited)")
+				return false, errors.New("process not found in tasklist output (may have exited)")
 			}
 		} else {
 			lines := strings.Split(strings.TrimSpace(string(output)), "\n")
 			if len(lines) < 2 {
-				return false, fmt.Errorf("process not found")
+				return false, errors.New("process not found")
 			}
 
 			// Parse CSV output (skip header line)
 			fields := strings.Split(lines[1], ",")
 			if len(fields) < 2 {
-				return false, fmt.Errorf("invalid process information format")
+				return false, errors.New("invalid process information format")
 			}
 
 			// Get executable path from wmic output
@@ -287,13 +288,13 @@ func getProcessDetails(pid int) (executable, workingDir string, err error) {
 		outputStr := strings.TrimSpace(string(tasklistOutput))
 		if outputStr == "" {
 			// Empty output likely means process doesn't exist
-			return "", "", fmt.Errorf("process not found (may have exited)")
+			return "", "", errors.New("process not found (may have exited)")
 		}
 
 		// Check for "No tasks" message
 		if strings.Contains(strings.ToLower(outputStr), "no tasks") ||
 			strings.Contains(strings.ToLower(outputStr), "not found") {
-			return "", "", fmt.Errorf("process not found in tasklist output (may have exited)")
+			return "", "", errors.New("process not found in tasklist output (may have exited)")
 		}
 
 		lines := strings.Split(outputStr, "\n")
@@ -313,18 +314,18 @@ func getProcessDetails(pid int) (executable, workingDir string, err error) {
 		}
 		// If we get here, it means no process was found in tasklist output
 		// This could be because the process exited or because tasklist returned "INFO: No tasks..."
-		return "", "", fmt.Errorf("process not found in tasklist output (may have exited)")
+		return "", "", errors.New("process not found in tasklist output (may have exited)")
 	}
 
 	lines := strings.Split(strings.TrimSpace(string(output)), "\n")
 	if len(lines) < 2 {
-		return "", "", fmt.Errorf("process not found")
+		return "", "", errors.New("process not found")
 	}
 
 	// Parse CSV output (skip header line)
 	fields := strings.Split(lines[1], ",")
 	if len(fields) < 2 {
-		return "", "", fmt.Errorf("invalid process information format")
+		return "", "", errors.New("invalid process information format")
 	}
 
 	executable = strings.Trim(fields[1], " \t\"")
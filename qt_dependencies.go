@@ -2,6 +2,7 @@ package main
 
 import (
 	"bufio"
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -299,7 +300,7 @@ func installQtDependencies(depInfo *QtDependencyInfo) error {
 
 	pm := getPackageManager()
 	if pm == nil {
-		return fmt.Errorf("no supported package manager found")
+		return errors.New("no supported package manager found")
 	}
 
 	logf("%s", stepLine("Installing Qt dependencies..."))
@@ -362,7 +363,7 @@ func ensureQtDependencies() error {
 	// Prompt user for permission
 	if !promptUserForPermission(depInfo) {
 		logf("%s", warnLine("User declined Qt dependency installation"))
-		return fmt.Errorf("Qt dependencies are required but installation was declined")
+		return errors.New("Qt dependencies are required but installation was declined")
 	}
 
 	// Install dependencies
@@ -377,7 +378,7 @@ func ensureQtDependencies() error {
 
 	if !newDepInfo.Installed {
 		logf("%s", warnLine("Qt dependency installation verification failed"))
-		return fmt.Errorf("Qt dependency installation verification failed")
+		return errors.New("Qt dependency installation verification failed")
 	}
 
 	logf("%s", successLine("Qt dependencies successfully installed and verified"))
@@ -409,7 +410,7 @@ func ensurePatchelfInstalled() error {
 	// Get the package manager
 	pm := getPackageManager()
 	if pm == nil {
-		return fmt.Errorf("no supported package manager found for patchelf installation")
+		return errors.New("no supported package manager found for patchelf installation")
 	}
 
 	logf("%s", infoLine(fmt.Sprintf("Installing patchelf using %s", pm.Name)))
@@ -450,7 +451,7 @@ func ensurePatchelfInstalled() error {
 	// Verify installation was successful
 	logf("%s", stepLine("Verifying patchelf installation"))
 	if _, err := exec.LookPath("patchelf"); err != nil {
-		return fmt.Errorf("patchelf installation verification failed: patchelf not found in PATH")
+		return errors.New("patchelf installation verification failed: patchelf not found in PATH")
 	}
 
 	// Test that patchelf actually works
@@ -67,6 +67,9 @@ func selfUpdate(root, exePath string, report func(string)) error {
 	logf("%s", stepLine("Downloading update..."))
 
 	tmpNew := exePath + ".new"
+	// Remove any leftover from an interrupted update; os.WriteFile keeps the
+	// mode of an existing file, which may not be executable
+	_ = os.Remove(tmpNew)
 	debugf("Downloading update to temporary file: %s", tmpNew)
 	if err := downloadTo(assetURL, tmpNew, 0755); err != nil {
 		debugf("Update download failed: %v", err)
@@ -141,6 +144,7 @@ func forceUpdate(root, exePath string, preferDev bool, report func(string)) erro
 	logf("%s", stepLine("Downloading update..."))
 
 	tmpNew := exePath + ".new"
+	_ = os.Remove(tmpNew) // don't inherit the mode of a stale .new
 	if err := downloadTo(assetURL, tmpNew, 0755); err != nil {
 		notify(fmt.Sprintf("Update download failed: %v", err))
 		return err
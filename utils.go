@@ -2,13 +2,17 @@ package main
 
 import (
 	"bufio"
+	"errors"
 	"flag"
 	"fmt"
 	"io"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"runtime"
 	"strings"
+	"sync"
+	"syscall"
 	"time"
 )
 
@@ -123,6 +127,13 @@ func logf(format string, args ...interface{}) {
 	// Create the log message
 	message := fmt.Sprintf(format+"\n", args...)
 
+	// Background downloads may have a \r progress line open; the display
+	// ends it before the message and redraws it afterwards
+	downloadProgress.log(message)
+}
+
+// writeLogMessage writes a formatted log message to out
+func writeLogMessage(message string) {
 	if out != nil {
 		if _, err := fmt.Fprint(out, message); err != nil {
 			fmt.Print(message)
@@ -154,10 +165,9 @@ func setupLogging(root string) func() {
 	previousLog := filepath.Join(logDir, "previous.log")
 	currentLog := filepath.Join(logDir, "latest.log")
 
-	if _, err := os.Stat(currentLog); err == nil {
-		_ = os.Remove(previousLog)
-		_ = os.Rename(currentLog, previousLog)
-	}
+	// Rename replaces an existing previous.log and simply fails when there is
+	// no latest.log yet, so no separate stat/remove is needed
+	_ = os.Rename(currentLog, previousLog)
 
 	// Create new log file
 	logFile, err := os.OpenFile(currentLog, os.O_CREATE|os.O_WRONLY|os.O_TRUNC, 0644)
@@ -203,11 +213,9 @@ func setupEmergencyCrashLogger(root string) {
 			stackTrace := string(buf[:stackLen])
 			fmt.Print(stackTrace)
 
-			// Write to crash file
+			// Write to crash file as a single append so the record stays contiguous
 			if file, err := os.OpenFile(crashLogPath, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0644); err == nil {
-				file.WriteString(crashMsg)
-				file.WriteString(stackTrace)
-				file.WriteString("\n=== END CRASH ===\n")
+				file.Write([]byte(crashMsg + stackTrace + "\n=== END CRASH ===\n"))
 				file.Close()
 				fmt.Printf("\nCrash details written to: %s\n", crashLogPath)
 			}
@@ -275,20 +283,121 @@ func waitEnter() {
 
 // -------------------- File Operations --------------------
 
+// copyBufferSize is the chunk size used for copies that have to go through
+// userspace (archive entries, decompressed streams). Larger chunks mean fewer
+// read/write syscalls per file than io.Copy's 32 KiB default.
+const copyBufferSize = 256 * 1024
+
+var copyBufferPool = sync.Pool{
+	New: func() interface{} {
+		buf := make([]byte, copyBufferSize)
+		return &buf
+	},
+}
+
+// copyBuffered copies src to dst through a pooled copyBufferSize buffer
+func copyBuffered(dst io.Writer, src io.Reader) (int64, error) {
+	bufp := copyBufferPool.Get().(*[]byte)
+	defer copyBufferPool.Put(bufp)
+
+	// Hide ReaderFrom/WriterTo so io.CopyBuffer actually uses our buffer
+	return io.CopyBuffer(struct{ io.Writer }{dst}, struct{ io.Reader }{src}, *bufp)
+}
+
+// copyFile streams src to dst without buffering the whole file in memory.
+// Same-filesystem copies on reflink-capable filesystems become a metadata
+// clone; otherwise the transfer is handed to the kernel.
 func copyFile(src, dst string) error {
-	input, err := os.ReadFile(src)
+	in, err := os.Open(src)
 	if err != nil {
 		return err
 	}
+	defer in.Close()
 
 	// Check if source file is executable and preserve permissions
-	info, err := os.Stat(src)
+	info, err := in.Stat()
 	if err != nil {
 		return err
 	}
 
 	// Preserve the same permissions as the source file
-	return os.WriteFile(dst, input, info.Mode())
+	outFile, err := os.OpenFile(dst, os.O_CREATE|os.O_WRONLY|os.O_TRUNC, info.Mode().Perm())
+	if err != nil {
+		return err
+	}
+
+	// Prefer a reflink clone; otherwise io.Copy between two files lets the
+	// runtime use copy_file_range/sendfile before any userspace loop
+	if err := cloneFile(outFile, in); err != nil {
+		if _, err := io.Copy(outFile, in); err != nil {
+			outFile.Close()
+			return err
+		}
+	}
+	if err := outFile.Close(); err != nil {
+		return err
+	}
+
+	// Keep the source timestamps like a regular install copy would
+	return os.Chtimes(dst, info.ModTime(), info.ModTime())
+}
+
+// ensureDir creates a directory that is expected not to exist yet, such as
+// one found while extracting an archive. os.MkdirAll stats the path first and
+// then walks up to the first existing parent, so a new leaf costs stat, stat
+// of the parent and mkdir; ensureDir tries the mkdir directly. An existing
+// path costs an extra stat to make sure it is a directory, which is why
+// directories that normally already exist should keep using os.MkdirAll.
+// Only a missing parent falls back to MkdirAll.
+func ensureDir(dir string, perm os.FileMode) error {
+	err := os.Mkdir(dir, perm)
+	if err == nil {
+		return nil
+	}
+	if errors.Is(err, fs.ErrExist) {
+		info, statErr := os.Stat(dir)
+		if statErr != nil {
+			return statErr
+		}
+		if !info.IsDir() {
+			return &os.PathError{Op: "mkdir", Path: dir, Err: syscall.ENOTDIR}
+		}
+		return nil
+	}
+	if errors.Is(err, fs.ErrNotExist) {
+		return os.MkdirAll(dir, perm)
+	}
+	return err
+}
+
+// dirSet remembers directories created during a batch operation (such as
+// extracting an archive) so ancestors shared by many entries are only
+// created once instead of re-walked for every file.
+type dirSet map[string]struct{}
+
+// ensure creates dir and its parents unless an earlier call already did
+func (d dirSet) ensure(dir string, perm os.FileMode) error {
+	dir = filepath.Clean(dir)
+	if _, ok := d[dir]; ok {
+		return nil
+	}
+	if err := ensureDir(dir, perm); err != nil {
+		return err
+	}
+
+	// ensureDir succeeded, so every ancestor exists as well
+	for p := dir; ; {
+		if _, ok := d[p]; ok {
+			break
+		}
+		d[p] = struct{}{}
+		parent := filepath.Dir(p)
+		if parent == p {
+			break
+		}
+		p = parent
+	}
+	return nil
 }
 
 func copyDir(src, dst string) error {
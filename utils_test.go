@@ -0,0 +1,202 @@
+package main
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"runtime"
+	"strings"
+	"testing"
+	"time"
+)
+
+// TestCopyFile verifies that copyFile reproduces content and mtime, and gives new files the source mode
+func TestCopyFile(t *testing.T) {
+	tempDir := t.TempDir()
+	src := filepath.Join(tempDir, "src.bin")
+	dst := filepath.Join(tempDir, "dst.bin")
+	existing := filepath.Join(tempDir, "existing.bin")
+
+	content := bytes.Repeat([]byte("theboys"), 200000)
+	if err := os.WriteFile(src, content, 0755); err != nil {
+		t.Fatalf("Failed to write source file: %v", err)
+	}
+
+	// Pre-create a larger destination to make sure it gets truncated
+	if err := os.WriteFile(existing, bytes.Repeat([]byte("x"), len(content)*2), 0644); err != nil {
+		t.Fatalf("Failed to write destination file: %v", err)
+	}
+
+	srcInfo, _ := os.Stat(src)
+	for _, path := range []string{dst, existing} {
+		if err := copyFile(src, path); err != nil {
+			t.Fatalf("copyFile(%s) failed: %v", path, err)
+		}
+
+		got, err := os.ReadFile(path)
+		if err != nil {
+			t.Fatalf("Failed to read destination file: %v", err)
+		}
+		if !bytes.Equal(got, content) {
+			t.Errorf("Copied content mismatch for %s: got %d bytes, want %d bytes", path, len(got), len(content))
+		}
+
+		dstInfo, err := os.Stat(path)
+		if err != nil {
+			t.Fatalf("Failed to stat destination file: %v", err)
+		}
+		if !dstInfo.ModTime().Equal(srcInfo.ModTime()) {
+			t.Errorf("ModTime = %v, want %v", dstInfo.ModTime(), srcInfo.ModTime())
+		}
+	}
+
+	// Like os.WriteFile, the mode (subject to umask) only applies to a newly created file
+	if runtime.GOOS != "windows" {
+		if info, _ := os.Stat(dst); info.Mode().Perm()&0100 == 0 {
+			t.Errorf("Mode = %v, want the owner execute bit from the source", info.Mode().Perm())
+		}
+		if info, _ := os.Stat(existing); info.Mode().Perm() != 0644 {
+			t.Errorf("Mode = %v, want existing mode %v to be kept", info.Mode().Perm(), os.FileMode(0644))
+		}
+	}
+}
+
+// TestDirSetEnsure verifies that dirSet creates nested directories and records ancestors
+func TestDirSetEnsure(t *testing.T) {
+	tempDir := t.TempDir()
+	dirs := dirSet{}
+
+	nested := filepath.Join(tempDir, "a", "b", "c")
+	if err := dirs.ensure(nested, 0755); err != nil {
+		t.Fatalf("ensure(%s) failed: %v", nested, err)
+	}
+
+	for _, dir := range []string{nested, filepath.Join(tempDir, "a", "b"), filepath.Join(tempDir, "a"), tempDir} {
+		if info, err := os.Stat(dir); err != nil || !info.IsDir() {
+			t.Errorf("Expected directory %s to exist", dir)
+		}
+		if _, ok := dirs[dir]; !ok {
+			t.Errorf("Expected %s to be recorded in dirSet", dir)
+		}
+	}
+
+	// A sibling only needs the new leaf to be created
+	sibling := filepath.Join(tempDir, "a", "b", "d")
+	if err := dirs.ensure(sibling, 0755); err != nil {
+		t.Fatalf("ensure(%s) failed: %v", sibling, err)
+	}
+	if !exists(sibling) {
+		t.Errorf("Expected directory %s to exist", sibling)
+	}
+}
+
+// TestEnsureDir verifies ensureDir handles new, existing and nested directories
+func TestEnsureDir(t *testing.T) {
+	tempDir := t.TempDir()
+
+	leaf := filepath.Join(tempDir, "leaf")
+	nested := filepath.Join(tempDir, "x", "y", "z")
+
+	for _, dir := range []string{leaf, leaf, nested} {
+		if err := ensureDir(dir, 0755); err != nil {
+			t.Fatalf("ensureDir(%s) failed: %v", dir, err)
+		}
+		if info, err := os.Stat(dir); err != nil || !info.IsDir() {
+			t.Errorf("Expected directory %s to exist", dir)
+		}
+	}
+
+	// A regular file in the way must be reported, not treated as a directory
+	file := filepath.Join(tempDir, "file")
+	if err := os.WriteFile(file, []byte("x"), 0644); err != nil {
+		t.Fatalf("Failed to write file: %v", err)
+	}
+	if err := ensureDir(file, 0755); err == nil {
+		t.Errorf("Expected ensureDir(%s) to fail for a regular file", file)
+	}
+	dirs := dirSet{}
+	if err := dirs.ensure(file, 0755); err == nil {
+		t.Errorf("Expected dirSet.ensure(%s) to fail for a regular file", file)
+	}
+	if _, ok := dirs[file]; ok {
+		t.Errorf("Expected %s not to be recorded in dirSet", file)
+	}
+}
+
+// TestProgressWriterThrottle verifies progress lines are only written per 5% step
+func TestProgressWriterThrottle(t *testing.T) {
+	var buf bytes.Buffer
+	prevOut := out
+	out = &buf
+	defer func() { out = prevOut }()
+
+	pw := &progressWriter{total: 1000, filename: "pack.zip", startTime: time.Now()}
+	chunk := make([]byte, 10)
+	for i := 0; i < 100; i++ {
+		if _, err := pw.Write(chunk); err != nil {
+			t.Fatalf("Write failed: %v", err)
+		}
+	}
+
+	lines := strings.Count(buf.String(), "\rDownloading")
+	if lines != 100/progressStep {
+		t.Errorf("Progress lines = %d, want %d", lines, 100/progressStep)
+	}
+	if !strings.HasSuffix(buf.String(), "100%)") {
+		t.Errorf("Expected final progress line to report 100%%, got %q", buf.String())
+	}
+
+	downloadProgress.finish(pw, "Downloaded pack.zip")
+	if !strings.HasSuffix(buf.String(), "100%)\nDownloaded pack.zip\n") {
+		t.Errorf("Expected completion on its own line, got %q", buf.String())
+	}
+}
+
+// TestProgressDisplayConcurrentDownloads verifies concurrent downloads share one progress line
+func TestProgressDisplayConcurrentDownloads(t *testing.T) {
+	var buf bytes.Buffer
+	prevOut := out
+	out = &buf
+	defer func() { out = prevOut }()
+
+	jre := &progressWriter{total: 100, filename: "jre.tar.gz", startTime: time.Now()}
+	jar := &progressWriter{total: 100, filename: "installer.jar", startTime: time.Now()}
+	jre.Write(make([]byte, 50))
+	jar.Write(make([]byte, 100))
+
+	last := buf.String()[strings.LastIndex(buf.String(), "\r"):]
+	if !strings.Contains(last, "jre.tar.gz") || !strings.Contains(last, "installer.jar") {
+		t.Errorf("Expected both downloads on the progress line, got %q", last)
+	}
+
+	downloadProgress.finish(jar, "Downloaded installer.jar")
+	downloadProgress.finish(jre, "")
+	if !strings.Contains(buf.String(), "\nDownloaded installer.jar\n\rDownloading jre.tar.gz") {
+		t.Errorf("Expected the remaining download to be redrawn after completion, got %q", buf.String())
+	}
+	if len(downloadProgress.active) != 0 {
+		t.Errorf("Expected no active downloads, got %d", len(downloadProgress.active))
+	}
+}
+
+// TestLogfDuringDownload verifies log lines never get appended to an open progress line
+func TestLogfDuringDownload(t *testing.T) {
+	var buf bytes.Buffer
+	prevOut := out
+	out = &buf
+	defer func() { out = prevOut }()
+
+	pw := &progressWriter{total: 100, filename: "jre.tar.gz", startTime: time.Now()}
+	defer downloadProgress.finish(pw, "")
+	pw.Write(make([]byte, 40))
+
+	logf("==> Downloading Prism portable build")
+
+	got := buf.String()
+	if strings.Contains(got, "%)==>") {
+		t.Errorf("Log line was glued onto the progress line: %q", got)
+	}
+	if !strings.Contains(got, "40%)\n==> Downloading Prism portable build\n\rDownloading jre.tar.gz") {
+		t.Errorf("Expected the log line on its own line followed by a redrawn progress line, got %q", got)
+	}
+}